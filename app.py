@@ -3,9 +3,12 @@ import pandas as pd
 import numpy as np
 import plotly.express as px
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import asyncio
+import aiohttp
 import feedparser
 from bs4 import BeautifulSoup
-from datetime import datetime
 from wordcloud import WordCloud
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.cluster import KMeans
@@ -13,6 +16,7 @@ import matplotlib.pyplot as plt
 import random
 import re
 import os
+import time
 from sklearn.metrics.pairwise import cosine_similarity
 
 # KeyBERT (키워드 추출) – 설치 안 돼 있으면 자동으로 fallback 되도록 처리
@@ -202,15 +206,161 @@ def generate_wordcloud(text):
 
 
 # ===============================================
-# Fear & Greed Proxy API (안정적, 차단 없음)
+# 공용 HTTP 세션 (keep-alive 커넥션 풀 + 재시도)
+# - 요청마다 TCP/TLS 핸드셰이크를 새로 하지 않도록
+#   동기 fetcher들이 전부 이 세션을 재사용한다
+# - CoinGecko 무료 티어의 429 등은 back-off 재시도로
+#   사용자에게 에러로 노출되지 않게 흡수한다
+# ===============================================
+SESSION = requests.Session()
+_retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+SESSION.mount("https://", HTTPAdapter(max_retries=_retry))
+SESSION.mount("http://", HTTPAdapter(max_retries=_retry))
+
+
+# ===============================================
+# 시계열 다운샘플링 (차트용)
+# - Plotly는 수천 포인트를 넘기면 렌더링이 급격히 느려진다
+# - tsdownsample(LTTB)이 있으면 모양을 보존하면서 줄이고,
+#   없으면 단순 stride 샘플링으로 fallback
+# ===============================================
+try:
+    from tsdownsample import LTTBDownsampler
+    _lttb = LTTBDownsampler()
+except Exception:
+    _lttb = None
+
+
+def downsample_series(df, x, y, n_out=1000):
+    if len(df) <= n_out:
+        return df
+
+    if _lttb is not None:
+        idx = _lttb.downsample(
+            df[x].astype("int64").to_numpy(),
+            df[y].to_numpy(),
+            n_out=n_out
+        )
+        return df.iloc[idx]
+
+    step = max(1, len(df) // n_out)
+    return df.iloc[::step]
+
+
 # ===============================================
-@st.cache_data(ttl=3600)
-def load_fear_greed_api():
-    url = "https://api.alternative.me/fng/?limit=2&format=json"  # 최근 2일 데이터 불러오기
+# 차트 Figure 캐시
+# - 같은 데이터면 px.line/px.bar로 figure를 다시 조립하지 않고
+#   직렬화된 figure를 그대로 재사용한다
+# ===============================================
+@st.cache_data(ttl=300, show_spinner=False)
+def build_active_addresses_fig(df):
+    df = downsample_series(df, "date", "active_addresses")
+    # SVG 대신 WebGL(Scattergl)로 그려 포인트가 많아져도 브라우저가 버틴다
+    return px.line(df, x="date", y="active_addresses", height=300,
+                   render_mode="webgl")
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def build_sector_change_fig(df):
+    return px.bar(
+        df,
+        x="core_sector",
+        y="avg_mcap_chg",
+        labels={"core_sector": "섹터", "avg_mcap_chg": "24h 변화율(%)"},
+    )
+
+
+# ===============================================
+# 홈 대시보드 API 동시 호출 (aiohttp)
+# - Fear&Greed / Global / 가격 / BTC 활성 주소 4개 요청을
+#   asyncio.gather로 겹쳐서 보내 cold cache 로딩 시간을
+#   "합"이 아니라 "최대 지연" 수준으로 줄인다
+# ===============================================
+FNG_URL = "https://api.alternative.me/fng/?limit=2&format=json"  # 최근 2일 데이터
+GLOBAL_URL = "https://api.coingecko.com/api/v3/global"
+BTC_ACTIVE_URL = "https://api.blockchain.info/charts/n-unique-addresses?timespan=30days&format=json"
+
+
+def _simple_price_url(ids):
+    return (
+        f"https://api.coingecko.com/api/v3/simple/price"
+        f"?ids={ids}&vs_currencies=usd&include_24hr_change=true"
+    )
+
+
+async def _fetch_json(session, url, retries=3, backoff=0.5):
+    # 동기 fetcher들의 SESSION 어댑터와 같은 조건으로 재시도한다
+    # (429는 Retry-After를 존중, 그 외는 지수 back-off)
+    # 실패를 Exception 객체로 들고 다니면 캐시의 pickle 왕복에서 깨질 수
+    # 있으므로(aiohttp 예외 일부는 unpickle 불가) None으로 정규화한다
+    for attempt in range(retries + 1):
+        delay = backoff * (2 ** attempt)
+        try:
+            async with session.get(url) as r:
+                if r.status in (429, 502, 503, 504) and attempt < retries:
+                    retry_after = r.headers.get("Retry-After", "")
+                    if retry_after.isdigit():
+                        delay = int(retry_after)
+                    await asyncio.sleep(delay)
+                    continue
+                return await r.json()
+        except Exception:
+            if attempt < retries:
+                await asyncio.sleep(delay)
+                continue
+            return None
+    return None
+
+
+async def _gather_json(urls):
+    timeout = aiohttp.ClientTimeout(total=5)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        # 개별 실패는 _fetch_json이 None으로 흡수하므로 나머지는 살아남는다
+        return await asyncio.gather(*[_fetch_json(session, u) for u in urls])
+
+
+@st.cache_resource
+def _payload_cache():
+    # 세션을 넘어 공유되는 {url: (받은 시각, json)} 저장소
+    return {}
+
+
+def load_home_payloads(ids):
+    """
+    홈 화면에서 쓰는 4개 API(JSON)를 불러온다.
+    - 엔드포인트별 TTL(원래 각 loader가 쓰던 값)을 URL 단위로 관리해
+      가격 때문에 Fear&Greed까지 60초마다 다시 받지 않도록 한다
+    - 만료된 URL만 골라 aiohttp로 동시에 다시 받는다
+    - 실패(None)는 저장하지 않으므로 다음 rerun에서 재시도되고,
+      만료된 이전 응답이 있으면 그걸 계속 보여준다
+    - 응답이 전혀 없는 URL은 None으로 돌려주고 파서가 fallback 처리
+    """
+    urls_ttl = [
+        (FNG_URL, 3600),
+        (GLOBAL_URL, 300),
+        (_simple_price_url(ids), 60),
+        (BTC_ACTIVE_URL, 300),
+    ]
+
+    cache = _payload_cache()
+    now = time.time()
+
+    stale = [u for u, ttl in urls_ttl if u not in cache or now - cache[u][0] >= ttl]
+    if stale:
+        for url, js in zip(stale, asyncio.run(_gather_json(stale))):
+            if js is not None:
+                cache[url] = (now, js)
 
+    return [cache[u][1] if u in cache else None for u, _ in urls_ttl]
+
+
+# ===============================================
+# Fear & Greed Proxy API (안정적, 차단 없음)
+# ===============================================
+def load_fear_greed_api(data):
     try:
-        r = requests.get(url, timeout=5)
-        data = r.json()
+        if data is None:
+            raise ValueError("응답 없음")
 
         today = data["data"][0]          # 오늘 데이터
         yesterday = data["data"][1]      # 전일 데이터
@@ -220,35 +370,33 @@ def load_fear_greed_api():
         diff = now_score - prev_score
         rating = today["value_classification"]
 
-        # timestamp → 날짜 변환
-        ts = int(today["timestamp"])
-        today_date = datetime.fromtimestamp(ts)
-
         # 히스토리용 데이터프레임 생성 (2일 이상 확장하려면 limit=30으로 바꾸면 됨)
-        hist = pd.DataFrame([
-            {
-                "date": datetime.fromtimestamp(int(item["timestamp"])),
-                "score": int(item["value"])
-            }
-            for item in data["data"]
-        ])
+        # 행 단위 dict 조립 대신 컬럼 단위로 한 번에 만든다
+        # API가 최신순으로 주는 걸 알고 있으니 뒤집기만 하면 정렬이 필요 없다
+        items = data["data"][::-1]
+        hist = pd.DataFrame({
+            "date": pd.to_datetime([int(i["timestamp"]) for i in items], unit="s"),
+            "score": [int(i["value"]) for i in items],
+        })
 
         return {
             "score": now_score,
             "rating": rating,
             "diff": diff,
-            "hist": hist.sort_values("date")
+            "hist": hist
         }
 
     except Exception as e:
         st.error(f"Fear & Greed Proxy API 오류: {e}")
+        # 시드 고정 Generator — rerun마다 더미 데이터가 흔들리지 않도록
+        rng = np.random.default_rng(42)
         return {
             "score": 50,
             "rating": "Neutral",
             "diff": 0,
             "hist": pd.DataFrame({
                 "date": pd.date_range(end=pd.Timestamp.today(), periods=30),
-                "score": np.random.randint(40, 60, 30),
+                "score": rng.integers(40, 60, 30),
             })
         }
 
@@ -259,26 +407,22 @@ def load_fear_greed_api():
 # - 의미: 최근 30일 동안 실제 사용된 BTC 주소 수
 # - 용도: 네트워크 활성도 / 시장 강도 판단
 # ===============================================
-@st.cache_data(ttl=300)  # 5분 캐시
-def load_btc_active_addresses():
+def load_btc_active_addresses(js):
     """
-    Blockchain.com Charts API를 이용하여
-    최근 30일 동안의 Bitcoin 활성 주소(active addresses) 데이터를 불러온다.
+    Blockchain.com Charts API(JSON)로부터
+    최근 30일 동안의 Bitcoin 활성 주소(active addresses) 데이터를 만든다.
 
     반환되는 데이터:
         - date: 날짜(datetime)
         - active_addresses: 활성 주소 수(int)
     """
-    url = "https://api.blockchain.info/charts/n-unique-addresses?timespan=30days&format=json"
-
     try:
-        # API 호출
-        r = requests.get(url, timeout=5)
-        js = r.json()
+        if js is None:
+            raise ValueError("응답 없음")
 
-        # 데이터프레임 변환
+        # 데이터프레임 변환 (행별 fromtimestamp 대신 벡터 변환)
         df = pd.DataFrame(js["values"])
-        df["date"] = df["x"].apply(lambda t: datetime.fromtimestamp(t))
+        df["date"] = pd.to_datetime(df["x"], unit="s")
         df = df.rename(columns={"y": "active_addresses"})
 
         return df[["date", "active_addresses"]]
@@ -286,17 +430,17 @@ def load_btc_active_addresses():
     except Exception as e:
         # 오류 시 더미 데이터 반환 (서비스 지속성 확보)
         st.error(f"BTC Active Addresses API 오류 발생: {e}")
+        rng = np.random.default_rng(42)
         return pd.DataFrame({
             "date": pd.date_range(end=pd.Timestamp.today(), periods=30),
-            "active_addresses": np.random.randint(700000, 900000, 30)
+            "active_addresses": rng.integers(700000, 900000, 30)
         })
 
 
 # ===============================================
 # CoinGecko 실시간 가격 API
 # ===============================================
-@st.cache_data(ttl=60)
-def load_prices_multi(coin_list):
+def load_prices_multi(coin_list, data):
     """
     coin_list 형식:
     [
@@ -304,17 +448,11 @@ def load_prices_multi(coin_list):
         {"id": "ethereum", "symbol": "ETH"},
         {"id": "solana", "symbol": "SOL"},
     ]
+    data: load_home_payloads()가 미리 받아온 simple/price JSON
     """
 
-    ids = ",".join([c["id"] for c in coin_list])
-
-    url = (
-        f"https://api.coingecko.com/api/v3/simple/price"
-        f"?ids={ids}&vs_currencies=usd&include_24hr_change=true"
-    )
-
-    r = requests.get(url, timeout=5)
-    data = r.json()
+    if data is None:
+        raise ValueError("가격 응답 없음")
 
     output = {}
     for c in coin_list:
@@ -329,34 +467,6 @@ def load_prices_multi(coin_list):
 
     return output
 
-# ===============================================
-# 글로벌 마켓 요약 (CoinGecko Global API)
-# ===============================================
-@st.cache_data(ttl=300)
-def load_global_market():
-    url = "https://api.coingecko.com/api/v3/global"
-    try:
-        r = requests.get(url, timeout=5)
-        data = r.json()["data"]
-
-        return {
-            "total_mcap": data["total_market_cap"].get("usd", 0),
-            "mcap_change_24h": data.get("market_cap_change_percentage_24h_usd", 0),
-            "btc_dominance": data["market_cap_percentage"].get("btc", 0),
-            "active_coins": data.get("active_cryptocurrencies", 0)
-        }
-    except Exception as e:
-        st.error(f"Global Market API 오류: {e}")
-        return {
-            "total_mcap": 0,
-            "mcap_change_24h": 0,
-            "btc_dominance": 0,
-            "active_coins": 0
-        }
-
-# ===============================================
-# Web3 섹터 시총 데이터 (실시간: CoinGecko Categories API)
-# ===============================================
 # ===============================================
 # Web3 섹터 시총 데이터 (실시간: CoinGecko Categories API)
 #  - 원시 카테고리 → 핵심 6개 섹터로 분류
@@ -384,26 +494,20 @@ def load_sectors_realtime():
     url = "https://api.coingecko.com/api/v3/coins/categories"
 
     try:
-        r = requests.get(url, timeout=5)
+        r = SESSION.get(url, timeout=5)
         data = r.json()
 
-        sectors = []
-        for d in data:
-            name = d.get("name", "Unknown")
-            mc = d.get("market_cap", 0)
-            mc_chg = d.get("market_cap_change_24h", 0)
-            category_id = d.get("id", "")
-
-            sectors.append({
-                "category_id": category_id,
-                "sector": name,
-                "market_cap": mc,
-                "market_cap_change_24h": mc_chg,
-                "core_sector": _classify_core_sector(name)
-            })
-
-        df = pd.DataFrame(sectors)
-        return df
+        # 행 단위 dict 조립 대신 응답 전체를 한 번에 DataFrame으로 만들고
+        # 컬럼 연산으로 정리한다 (카테고리 수백 개 기준 파이썬 루프 제거)
+        df = pd.DataFrame(data)
+        df = df.rename(columns={"id": "category_id", "name": "sector"})
+        df = df[["category_id", "sector", "market_cap", "market_cap_change_24h"]]
+        df["sector"] = df["sector"].fillna("Unknown")
+        df["market_cap"] = df["market_cap"].fillna(0)
+        df["market_cap_change_24h"] = df["market_cap_change_24h"].fillna(0)
+        df["core_sector"] = df["sector"].map(_classify_core_sector)
+        # Arrow 백엔드 dtype — 문자열 컬럼 메모리를 줄이고 groupby가 빨라진다
+        return df.convert_dtypes(dtype_backend="pyarrow")
 
     except Exception as e:
         st.error(f"Sectors API 오류: {e}")
@@ -412,11 +516,11 @@ def load_sectors_realtime():
 
 
 # ===============================================
-# 섹터별 Top 상승/하락 프로젝트
-# category_id 기준으로 조회
+# 섹터별 코인 마켓 데이터
+# category_id 기준으로 조회 — 정렬은 호출부에서 concat 후 한 번만
 # ===============================================
 @st.cache_data(ttl=300)
-def load_sector_top_movers(category, top=10):
+def load_sector_markets(category):
     url = (
         "https://api.coingecko.com/api/v3/coins/markets"
         f"?vs_currency=usd&category={category}&order=market_cap_desc"
@@ -424,19 +528,12 @@ def load_sector_top_movers(category, top=10):
     )
 
     try:
-        r = requests.get(url, timeout=5)
-        data = r.json()
-        df = pd.DataFrame(data)
-
-        df = df[["name", "symbol", "current_price", "price_change_percentage_24h"]]
-
-        top_gainers = df.sort_values("price_change_percentage_24h", ascending=False).head(top)
-        top_losers = df.sort_values("price_change_percentage_24h").head(top)
-
-        return top_gainers, top_losers
+        r = SESSION.get(url, timeout=5)
+        df = pd.DataFrame(r.json())
+        return df[["name", "symbol", "current_price", "price_change_percentage_24h"]]
 
     except:
-        return pd.DataFrame(), pd.DataFrame()
+        return pd.DataFrame()
 
 
 # ===============================================
@@ -454,7 +551,7 @@ def load_news_all():
 
     # -------- 1) CryptoPanic API (글로벌, 영어) --------
     try:
-        res = requests.get("https://cryptopanic.com/api/v1/posts/?auth_token=&public=true", timeout=5)
+        res = SESSION.get("https://cryptopanic.com/api/v1/posts/?auth_token=&public=true", timeout=5)
         js = res.json()
         for item in js.get("results", []):
             news_items.append({
@@ -501,7 +598,7 @@ def load_news_all():
 
     # -------- 4) (옵션) 코인데스크 한국어 HTML 스크래핑 — 구조 바뀌면 깨질 수 있음 --------
     try:
-        r = requests.get("https://www.coindesk.com/ko", timeout=5)
+        r = SESSION.get("https://www.coindesk.com/ko", timeout=5)
         soup = BeautifulSoup(r.text, "html.parser")
         # 메인 기사 카드 기준으로 제목 일부 긁기 (필요시 직접 class 수정하면 됨)
         for h in soup.find_all("h3")[:15]:
@@ -520,7 +617,8 @@ def load_news_all():
     df = pd.DataFrame(news_items)
     if df.empty:
         return pd.DataFrame(columns=["title", "source", "summary_raw", "lang"])
-    return df
+    # Arrow 백엔드 dtype — object 문자열 대비 메모리가 크게 줄어든다
+    return df.convert_dtypes(dtype_backend="pyarrow")
 
 
 # ===============================================
@@ -565,9 +663,12 @@ def summarize(text, max_sentences=3, max_chars=400):
 # 뉴스 본문 넘기기 (문장 단위 그래프 랭킹)
 # ===============================================
 
+# 기사 본문은 불변이므로 뉴스 목록(load_news_all, 30분)보다 훨씬 길게 캐시한다
+# → 목록이 갱신돼도 피드에 남아 있는 기사는 본문을 다시 받지 않는다
+@st.cache_data(ttl=6 * 3600, show_spinner=False)
 def extract_article_body(url):
     try:
-        r = requests.get(url, timeout=5)
+        r = SESSION.get(url, timeout=5)
         soup = BeautifulSoup(r.text, "html.parser")
 
         # 뉴스 사이트 공통 패턴
@@ -594,6 +695,31 @@ def extract_article_body(url):
         return ""
 
 
+# ===============================================
+# TextRank 점수 계산 (PageRank 유사 power iteration)
+# numba가 설치돼 있으면 njit로 컴파일 — 문장 수가 많아도
+# 반복 루프가 네이티브 코드로 돈다 (없으면 NumPy 그대로)
+# ===============================================
+def _textrank_scores(sim_matrix, d=0.85, n_iter=20):
+    n = sim_matrix.shape[0]
+    scores = np.ones(n) / n
+
+    # 행 합은 반복 내내 변하지 않으므로 루프 밖에서 한 번만 계산
+    row_sums = sim_matrix.sum(axis=1) + 1e-8
+
+    for _ in range(n_iter):
+        scores = (1 - d) / n + d * sim_matrix.dot(scores) / row_sums
+
+    return scores
+
+
+try:
+    import numba
+    _textrank_scores = numba.njit(cache=True)(_textrank_scores)
+except Exception:
+    pass
+
+
 # ===============================================
 # 한국어 TextRank 요약 (문장 단위 그래프 랭킹)
 # ===============================================
@@ -620,12 +746,7 @@ def textrank_summarize(text, max_sent=3):
     sim_matrix = cosine_similarity(X, X)
 
     # 4) TextRank 반복 (PageRank 유사)
-    n = sim_matrix.shape[0]
-    scores = np.ones(n) / n
-    d = 0.85  # damping factor
-
-    for _ in range(20):
-        scores = (1 - d) / n + d * sim_matrix.dot(scores) / (sim_matrix.sum(axis=1) + 1e-8)
+    scores = _textrank_scores(sim_matrix)
 
     # 5) 상위 점수 문장 max_sent개 선택 (원래 순서 유지)
     ranked_idx = np.argsort(scores)[::-1][:max_sent]
@@ -672,6 +793,19 @@ def extract_keywords(text, top_k=5):
 
 
 
+# ===============================================
+# 뉴스 요약/키워드 enrich
+# - 같은 페이지를 다시 열 때 TextRank/TF-IDF를 재계산하지 않도록
+#   입력 프레임 내용 기준으로 캐시한다
+# ===============================================
+@st.cache_data(ttl=1800, show_spinner=False)
+def enrich_news(df):
+    return df.assign(
+        summary=df["summary_raw"].apply(lambda x: textrank_summarize(x, max_sent=3)),
+        keywords=df["summary_raw"].apply(lambda x: extract_keywords(x, top_k=5)),
+    )
+
+
 # ===============================================
 # Topic Clustering (뉴스 토픽 클러스터링)
 # ===============================================
@@ -701,13 +835,11 @@ def topic_clustering(df, n_clusters=5):
 # Global Market Summary (시총 / 도미넌스 / 거래량)
 # CoinGecko Free API
 # ===============================================
-@st.cache_data(ttl=300)
-def load_global_market():
-    url = "https://api.coingecko.com/api/v3/global"
-
+def load_global_market(js):
     try:
-        r = requests.get(url, timeout=5)
-        data = r.json()["data"]
+        if js is None:
+            raise ValueError("응답 없음")
+        data = js["data"]
 
         return {
             "market_cap": data["total_market_cap"]["usd"],
@@ -744,10 +876,6 @@ if page == "📌 Home":
 
     st.title("📊 Web3 Chain Radar Dashboard")
 
-    # 데이터 불러오기
-    fg = load_fear_greed_api()
-    global_mkt = load_global_market()
-
     # 실시간 가격
     coin_list = [
         {"id": "bitcoin", "symbol": "BTC"},
@@ -755,7 +883,13 @@ if page == "📌 Home":
         {"id": "solana", "symbol": "SOL"},
     ]
 
-    prices = load_prices_multi(coin_list)
+    # 4개 API를 한 번에(동시에) 불러온 뒤 각 파서에 넘긴다
+    ids = ",".join([c["id"] for c in coin_list])
+    fng_js, global_js, price_js, btc_js = load_home_payloads(ids)
+
+    fg = load_fear_greed_api(fng_js)
+    gm = load_global_market(global_js)
+    prices = load_prices_multi(coin_list, price_js)
 
     col1, col2, col3, col4 = st.columns(4)
    
@@ -777,8 +911,6 @@ if page == "📌 Home":
     
     st.subheader("🌍 Global Market Summary")
 
-    gm = load_global_market()
-
     g1, g2, g3, g4 = st.columns(4)
 
     with g1:
@@ -816,9 +948,9 @@ if page == "📌 Home":
     # CENTER ---------------------------
     with center:
         st.subheader("📈 BTC Active Addresses (30일 실데이터)")
-        btc_active = load_btc_active_addresses()
+        btc_active = load_btc_active_addresses(btc_js)
         st.plotly_chart(
-            px.line(btc_active, x="date", y="active_addresses", height=300),
+            build_active_addresses_fig(btc_active),
             use_container_width=True
         )
       
@@ -853,15 +985,13 @@ elif page == "📰 News":
     if df.empty:
         st.warning("불러온 뉴스가 없습니다. 잠시 후 다시 시도해 주세요.")
     else:
-        # TextRank 요약 + KeyBERT 키워드 생성
-        df["summary"] = df["summary_raw"].apply(lambda x: textrank_summarize(x, max_sent=3))
-        df["keywords"] = df["summary_raw"].apply(lambda x: extract_keywords(x, top_k=5))
-
         # 언어 필터
         st.subheader("🧩 필터")
         lang_opt = st.selectbox("언어", ["전체", "한국어만", "영어만"])
 
-        df_page_base = df.copy()
+        # 필터/슬라이스/assign 모두 새 프레임을 만들기 때문에
+        # 여기서 전체를 copy할 필요가 없다
+        df_page_base = df
 
         if lang_opt == "한국어만":
             df_page_base = df_page_base[df_page_base["lang"] == "ko"]
@@ -884,6 +1014,10 @@ elif page == "📰 News":
 
         df_page = df_page_base.iloc[start:end]   # ← 여기! df_view → df_page
 
+        # TextRank 요약 + KeyBERT 키워드 생성
+        # 전체 뉴스가 아니라 화면에 보이는 10개에 대해서만 계산한다
+        df_page = enrich_news(df_page)
+
         # 테이블 요약
         st.subheader("📄 뉴스 리스트")
         st.dataframe(
@@ -894,12 +1028,16 @@ elif page == "📰 News":
         # 뉴스 카드 상세
         st.subheader("📰 뉴스 상세 카드")
 
-        for _, row in df_page.iterrows():        # ← 여기! df_view → df_page
-            st.markdown(f"### {row['title']}")
-            st.markdown(f"**Source:** {row['source']} · **언어:** {row['lang']}")
-            st.markdown(f"**키워드:** {row['keywords']}")
-            st.write(row["summary"])
-            st.divider()
+        # 카드 10개 × 5개 위젯을 따로 그리지 않고
+        # 마크다운 한 덩어리로 만들어 한 번만 렌더링한다
+        cards = [
+            f"### {row['title']}\n\n"
+            f"**Source:** {row['source']} · **언어:** {row['lang']}\n\n"
+            f"**키워드:** {row['keywords']}\n\n"
+            f"{row['summary']}"
+            for _, row in df_page.iterrows()
+        ]
+        st.markdown("\n\n---\n\n".join(cards))
 
         # WordCloud (요약 기반)
         st.subheader("☁️ 요약 기반 WordCloud")
@@ -932,10 +1070,8 @@ elif page == "🧩 Sectors":
             .reset_index()
         )
 
-        # Infra/기타는 맨 아래로 보내기
-        core_summary["sort_key"] = core_summary["core_sector"].apply(
-            lambda x: 1 if x == "Infra/기타" else 0
-        )
+        # Infra/기타는 맨 아래로 보내기 (행별 람다 대신 벡터 비교)
+        core_summary["sort_key"] = core_summary["core_sector"].eq("Infra/기타").astype(int)
         core_summary = core_summary.sort_values(["sort_key", "core_sector"]).drop(columns=["sort_key"])
 
         st.subheader("📊 핵심 섹터별 시총 & 24h 변화율")
@@ -943,12 +1079,7 @@ elif page == "🧩 Sectors":
 
         # 변화율 바 차트
         st.subheader("📈 섹터별 24h 시총 변화율 (평균)")
-        fig_bar = px.bar(
-            core_summary,
-            x="core_sector",
-            y="avg_mcap_chg",
-            labels={"core_sector": "섹터", "avg_mcap_chg": "24h 변화율(%)"},
-        )
+        fig_bar = build_sector_change_fig(core_summary)
         st.plotly_chart(fig_bar, use_container_width=True)
 
         st.subheader("📈 섹터별 Top Movers (코인 단위)")
@@ -959,31 +1090,30 @@ elif page == "🧩 Sectors":
         # 선택된 core 섹터에 속한 원시 카테고리들
         subset_cats = sectors_rt[sectors_rt["core_sector"] == chosen_core]
 
-        all_gainers = []
-        all_losers = []
-
+        # 카테고리별로 정렬/상위권을 따로 구하지 않고
+        # 한 번에 이어붙인 뒤 nlargest/nsmallest로 한 번만 뽑는다
+        # 프레임마다 category 컬럼을 복사해 넣는 대신 concat의 keys=로 라벨링
+        frames = []
+        labels = []
         for _, row in subset_cats.iterrows():
-            cat_id = row["category_id"]
-            top_g, top_l = load_sector_top_movers(cat_id, top=5)
-            if not top_g.empty:
-                top_g["category"] = row["sector"]
-                all_gainers.append(top_g)
-            if not top_l.empty:
-                top_l["category"] = row["sector"]
-                all_losers.append(top_l)
-
-        if all_gainers:
-            df_g = pd.concat(all_gainers, ignore_index=True)
-            df_g = df_g.sort_values("price_change_percentage_24h", ascending=False).head(10)
+            mkts = load_sector_markets(row["category_id"])
+            if not mkts.empty:
+                frames.append(mkts)
+                labels.append(row["sector"])
+
+        if frames:
+            all_mkts = (
+                pd.concat(frames, keys=labels, names=["category", None])
+                .reset_index(level="category")
+                .reset_index(drop=True)
+            )
+
+            df_g = all_mkts.nlargest(10, "price_change_percentage_24h")
             st.markdown("🔼 **상승 Top 10 코인**")
             st.dataframe(df_g, height=300)
-        else:
-            st.info("상승 코인 데이터를 가져오지 못했습니다.")
 
-        if all_losers:
-            df_l = pd.concat(all_losers, ignore_index=True)
-            df_l = df_l.sort_values("price_change_percentage_24h", ascending=True).head(10)
+            df_l = all_mkts.nsmallest(10, "price_change_percentage_24h")
             st.markdown("🔽 **하락 Top 10 코인**")
             st.dataframe(df_l, height=300)
         else:
-            st.info("하락 코인 데이터를 가져오지 못했습니다.")
+            st.info("상승/하락 코인 데이터를 가져오지 못했습니다.")